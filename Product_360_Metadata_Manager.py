@@ -1,11 +1,40 @@
 import os
+import re
 import shutil
+import stat
+import sys
 import json
+import locale
 import logging
+import logging.handlers
+import atexit
+import time
 from datetime import date
 from tkinter import ttk, messagebox, Tk, StringVar
 from tkinter.filedialog import askdirectory
 import traceback
+import functools
+import threading
+import queue
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson  # Optional
+except ImportError:
+    orjson = None
+
+if os.name == "nt":
+    import ctypes
+    from ctypes import wintypes
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.CopyFileExW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, wintypes.DWORD]
+    _kernel32.CopyFileExW.restype = wintypes.BOOL
+    _kernel32.GetLogicalDrives.argtypes = []
+    _kernel32.GetLogicalDrives.restype = wintypes.DWORD
+    _kernel32.GetDriveTypeW.argtypes = [wintypes.LPCWSTR]
+    _kernel32.GetDriveTypeW.restype = wintypes.UINT
 
 # Constants
 ARCHIVE_BASE = os.path.join(os.path.expanduser("~/Desktop"), "Product 360 layout backup")
@@ -18,90 +47,439 @@ SOURCE_FILES = {
     "savedTableConfigs.xml": os.path.join(".metadata", ".plugins", "com.heiler.ppm.std.ui", "savedTableConfigs.xml")
 }
 
-EXCLUDED_DIRS = {"Windows", "Program Files", "Program Files (x86)", "System Volume Information", "$RECYCLE.BIN"}
+# Lowercase names
+EXCLUDED_DIRS = frozenset({
+    "windows", "program files", "program files (x86)", "system volume information",
+    "$recycle.bin", "$windows.~bt", "recovery", "appdata", "node_modules",
+})
+
+# Folder name fragments that mark a subtree worth searching
+LIKELY_KEYWORDS = ("informatica", "pim", "product 360")
+_LIKELY_RE = re.compile("|".join(map(re.escape, LIKELY_KEYWORDS)), re.IGNORECASE)
+
+DRIVE_FIXED = 3
+
+def _other_fixed_drives():
+    """Return the root of every local fixed drive except C: (none off Windows)."""
+    if os.name != "nt":
+        return []
+    mask = _kernel32.GetLogicalDrives()
+    drives = (f"{chr(ord('A') + i)}:\\" for i in range(26) if mask & (1 << i))
+    return [drive for drive in drives if drive != "C:\\" and _kernel32.GetDriveTypeW(drive) == DRIVE_FIXED]
+
+# Starting points for the install search
+SEARCH_ROOTS = [root for root in (
+    "C:\\",
+    *_other_fixed_drives(),
+    "C:\\Program Files",
+    "C:\\Program Files (x86)",
+    os.path.expanduser("~"),
+    os.environ.get("LOCALAPPDATA"),
+    os.environ.get("PROGRAMDATA"),
+    "C:\\Informatica",
+    "C:\\PIM",
+    "C:\\Product 360",
+) if root]
+MAX_SEARCH_DEPTH = 4
+SEARCH_WORKERS = 8
+# Saved search results younger than this are used without asking
+SCAN_TTL = 7 * 24 * 60 * 60
+
+# Hidden/system folders and reparse points are skipped
+_SKIPPED_ATTRIBUTES = stat.FILE_ATTRIBUTE_HIDDEN | stat.FILE_ATTRIBUTE_SYSTEM | stat.FILE_ATTRIBUTE_REPARSE_POINT
 
 # Setup logging
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 os.makedirs(ARCHIVE_BASE, exist_ok=True)
-logging.basicConfig(filename=LOG_FILE, level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+_log_file_handler = logging.FileHandler(LOG_FILE)
+_log_file_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_file_handler)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.getLogger().setLevel(logging.INFO)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+logger = logging.getLogger(__name__)
+
+def is_likely_folder(name):
+    """Check whether a folder name contains one of LIKELY_KEYWORDS."""
+    return _LIKELY_RE.search(name) is not None
+
+def _is_hidden_dir(entry):
+    """Check a scandir entry for hidden/system/reparse-point attributes."""
+    if os.name == "nt":
+        return bool(entry.stat(follow_symlinks=False).st_file_attributes & _SKIPPED_ATTRIBUTES)
+    return entry.name.startswith(".")
+
+def _dir_mtime(path):
+    """Return a folder's mtime in nanoseconds, or None if it cannot be read."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
 
-def find_installations(root_window):
-    """Search C: for pim-desktop.exe, excluding system folders."""
+def _scan_root(root, skip, cancel=None):
+    """Search one root, leaving the roots in skip to their own scan; None if cancelled."""
     installations = []
-    messagebox.showinfo("Search Starting", "Searching for Product 360 installations... This may take a few moments.", parent=root_window)
-    for root, dirs, files in os.walk("C:\\", topdown=True):
-        if any(excluded.lower() == os.path.basename(root).lower() for excluded in EXCLUDED_DIRS):
+    folders = {}
+    pending = deque([(root, 0, is_likely_folder(os.path.basename(root)), _dir_mtime(root))])
+    excluded = EXCLUDED_DIRS
+    likely_search = _LIKELY_RE.search
+    normcase = os.path.normcase
+    cancelled = cancel.is_set if cancel is not None else lambda: False
+    popleft = pending.popleft
+    while pending:
+        if cancelled():
+            return None
+        path, depth, likely, mtime = popleft()
+        folders[path] = mtime
+        has_exe = has_cmd = False
+        children = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    name_lower = entry.name.lower()
+                    if name_lower == "pim-desktop.exe":
+                        has_exe = True
+                    elif name_lower == "pim-desktop.cmd":
+                        has_cmd = True
+                    elif depth < MAX_SEARCH_DEPTH and entry.is_dir(follow_symlinks=False):
+                        if name_lower in excluded or _is_hidden_dir(entry):
+                            continue
+                        if not (likely or likely_search(entry.name)):
+                            continue
+                        if normcase(entry.path) in skip:
+                            continue
+                        children.append((entry.path, depth + 1, True, entry.stat(follow_symlinks=False).st_mtime_ns))
+        except OSError:
             continue
-        if "pim-desktop.exe" in files:
-            installations.append(root)
-    return installations
+        # Only folders with both files are installs
+        if has_exe and has_cmd:
+            installations.append(path)
+        else:
+            pending.extend(children)
+    return installations, folders
+
+def _root_unchanged(folders):
+    """Check that every folder listed by a previous scan still has the same mtime."""
+    return all(_dir_mtime(path) == mtime for path, mtime in folders.items())
+
+def find_installations(scan_meta=None, on_found=None, cancel=None):
+    """Search likely locations for pim-desktop.exe/.cmd, reusing unchanged roots from scan_meta."""
+    cached_roots = (scan_meta or {}).get("roots", {})
+    stale = [root for root in SEARCH_ROOTS if root not in cached_roots or not _root_unchanged(cached_roots[root]["folders"])]
+    installations = []
+
+    def report(found):
+        for install_folder in found:
+            if install_folder not in installations:
+                installations.append(install_folder)
+                if on_found:
+                    on_found(install_folder)
+
+    roots = {root: cached_roots[root] for root in SEARCH_ROOTS if root not in stale}
+    for result in roots.values():
+        report(result["installations"])
+    if stale:
+        root_keys = {os.path.normcase(root) for root in SEARCH_ROOTS}
+        with ThreadPoolExecutor(max_workers=min(SEARCH_WORKERS, len(stale))) as executor:
+            futures = {executor.submit(_scan_root, root, root_keys - {os.path.normcase(root)}, cancel): root for root in stale}
+            for future in as_completed(futures):
+                result = future.result()
+                if result is None:
+                    continue
+                found, folders = result
+                roots[futures[future]] = {"installations": found, "folders": folders}
+                report(found)
+    cancelled = cancel is not None and cancel.is_set()
+    return installations, {
+        "timestamp": 0 if cancelled else time.time(),
+        "roots": {root: roots[root] for root in SEARCH_ROOTS if root in roots},
+    }
+
+CMD_HEAD_SIZE = 4096
+# "SET WORKSPACE_DIR=" at the start of a line, after optional whitespace
+_WORKSPACE_DIR_RE = re.compile(rb"^[^\S\n]*SET WORKSPACE_DIR=([^\n]*)", re.MULTILINE)
+
+def _parse_workspace_dir(data):
+    """Return the expanded WORKSPACE_DIR set in a block of whole lines, or None."""
+    match = _WORKSPACE_DIR_RE.search(data)
+    if match:
+        value = match.group(1).strip().decode(locale.getpreferredencoding(False))
+        return os.path.expandvars(value)
+    return None
 
 def extract_workspace_dir(install_folder):
     """Read WORKSPACE_DIR from pim-desktop.cmd."""
     cmd_path = os.path.join(install_folder, "pim-desktop.cmd")
-    if os.path.exists(cmd_path):
-        with open(cmd_path, "r") as f:
-            for line in f:
-                if line.strip().startswith("SET WORKSPACE_DIR="):
-                    parts = line.split("=", 1)
-                    value = parts[1].strip()
-                    expanded_value = os.path.expandvars(value)
-                    return expanded_value
-    return None
+    try:
+        f = open(cmd_path, "rb")
+    except FileNotFoundError:
+        return None
+    with f:
+        # The SET line is usually near the top
+        workspace_dir = _parse_workspace_dir(f.read(CMD_HEAD_SIZE) + f.readline())
+        if workspace_dir is None:
+            workspace_dir = _parse_workspace_dir(f.read())
+    return workspace_dir
 
-        response = messagebox.askyesno("Use Saved Locations", "Use previously saved locations? (No = Search again)", parent=root_window)
-        if response is None:
-            return {}
-        elif response:
-    """Load environments from config or find them."""
+# CONFIG_FILE as last read or written
+_last_saved = None
+_config_cache = None
+_config_mtime = None
+
+def _dumps(config):
+    """Serialize the config to compact JSON bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(config)
+    return json.dumps(config, separators=(",", ":")).encode()
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+def load_config():
+    """Read CONFIG_FILE, reusing the cached copy while its mtime is unchanged."""
+    global _last_saved, _config_cache, _config_mtime
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except FileNotFoundError:
+        _last_saved = _config_cache = _config_mtime = None
+        return {"environments": {}, "scan_meta": {}}
+    if _config_cache is None or mtime != _config_mtime:
+        with open(CONFIG_FILE, "rb") as f:
+            text = f.read()
+        config = _loads(text)
+        if "environments" not in config:
+            config = {"environments": config, "scan_meta": {}}
+        _last_saved = text
+        _config_cache = config
+        _config_mtime = mtime
+    return {"environments": dict(_config_cache["environments"]), "scan_meta": _config_cache["scan_meta"]}
+
+def save_config(environments, scan_meta=None):
+    """Atomically write the config, keeping the saved scan_meta if none is given."""
+    global _last_saved, _config_cache, _config_mtime
+    saved = load_config()
+    if scan_meta is None:
+        scan_meta = saved["scan_meta"]
+    text = _dumps({"environments": environments, "scan_meta": scan_meta})
+    if text == _last_saved:
+        return
+    tmp_file = CONFIG_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(text)
+    os.replace(tmp_file, CONFIG_FILE)
+    _last_saved = text
+    _config_cache = {"environments": dict(environments), "scan_meta": scan_meta}
+    _config_mtime = os.stat(CONFIG_FILE).st_mtime_ns
+
+def load_or_find_environments(root_window):
+    """Load environments from config, or return None to search again."""
     if os.path.exists(CONFIG_FILE):
+        config = load_config()
+        environments = config["environments"]
+        scanned_at = config["scan_meta"].get("timestamp", 0)
+        if environments and time.time() - scanned_at < SCAN_TTL and all(os.path.isdir(folder) for folder in environments):
+            return environments
         if messagebox.askyesno("Use Saved Locations", "Use previously saved locations? (No = Search again)", parent=root_window):
-            with open(CONFIG_FILE, "r") as f:
-                return json.load(f)
+            return environments
+    return None
+
+def _unique_backup_name(base_name, taken, next_suffix):
+    """Return base_name or the next free base_name_N, and add it to taken."""
+    n = next_suffix[base_name]
+    unique_name = base_name if n == 0 else f"{base_name}_{n}"
+    while unique_name in taken:
+        n += 1
+        unique_name = f"{base_name}_{n}"
+    next_suffix[base_name] = n + 1
+    taken.add(unique_name)
+    return unique_name
+
+def search_environments(on_environment, cancel=None):
+    """Search for installations and pass each to on_environment with a unique backup name."""
+    config = load_config()
+    previous = config["environments"]
+    backup_names = {entry["backup_name"] for entry in previous.values()}
+    next_suffix = Counter()
+
+    def add_installation(install_folder):
+        try:
+            workspace_dir = extract_workspace_dir(install_folder)
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning("Skipping %s, cannot read pim-desktop.cmd: %s", install_folder, e)
+            return
+        if workspace_dir:
+            if install_folder in previous:
+                unique_name = previous[install_folder]["backup_name"]
+            else:
+                unique_name = _unique_backup_name(os.path.basename(install_folder), backup_names, next_suffix)
+            on_environment(install_folder, {"workspace_dir": workspace_dir, "backup_name": unique_name})
+
+    _, scan_meta = find_installations(config["scan_meta"], on_found=add_installation, cancel=cancel)
+    return scan_meta
+
+COPY_BUFFER_SIZE = 1024 * 1024
+
+def _copy_buffered(src, dst):
+    """Copy a file through a 1 MiB buffer, then copy its timestamps."""
+    buf = bytearray(COPY_BUFFER_SIZE)
+    view = memoryview(buf)
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            fdst.write(view[:n])
+    shutil.copystat(src, dst)
+
+# In-kernel copy calls, tried in order: (in_fd, out_fd, offset) -> bytes copied
+_KERNEL_COPIES = []
+if hasattr(os, "copy_file_range"):
+    _KERNEL_COPIES.append(lambda in_fd, out_fd, offset: os.copy_file_range(in_fd, out_fd, 1 << 30, offset, offset))
+if sys.platform.startswith("linux") and hasattr(os, "sendfile"):
+    _KERNEL_COPIES.append(lambda in_fd, out_fd, offset: os.sendfile(out_fd, in_fd, offset, 1 << 30))
+
+def _copy_kernel(src, dst):
+    """Copy a file in the kernel; return False if that is not supported."""
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(in_fd).st_size
+        for copy_chunk in _KERNEL_COPIES:
+            offset = 0
+            try:
+                while True:
+                    copied = copy_chunk(in_fd, out_fd, offset)
+                    if not copied:
+                        break
+                    offset += copied
+            except OSError:
+                # Unsupported for these files; try the next call
+                if offset:
+                    raise
+                continue
+            # Some filesystems answer copy_file_range with 0 instead of an error
+            if offset == 0 and size:
+                continue
+            break
         else:
-            return search_and_save_environments(root_window)
+            return False
+    shutil.copystat(src, dst)
+    return True
+
+def _fast_copy(src, dst):
+    """Copy a file with its timestamps, using an OS copy call where possible."""
+    if os.name == "nt":
+        if not _kernel32.CopyFileExW(src, dst, None, None, None, 0):
+            raise ctypes.WinError(ctypes.get_last_error())
+    elif not (_KERNEL_COPIES and _copy_kernel(src, dst)):
+        _copy_buffered(src, dst)
+
+@functools.lru_cache(maxsize=None)
+def _workspace_paths(workspace_dir):
+    """Return (filename, absolute path) for each of SOURCE_FILES inside a workspace."""
+    prefix = os.path.join(workspace_dir, "")
+    return tuple((filename, prefix + rel_path) for filename, rel_path in SOURCE_FILES.items())
+
+def _list_parents(paths):
+    """Map each parent folder of paths to its file names, or None if it is missing."""
+    listings = {}
+    for path in paths:
+        parent = os.path.dirname(path)
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                listings[parent] = None
+    return listings
+
+def _backup_file(source_path, dest_file):
+    """Copy one metadata file into the backup folder unless it is already current."""
+    try:
+        source_stat = os.stat(source_path)
+    except OSError:
+        source_stat = None
+    if source_stat is None or not stat.S_ISREG(source_stat.st_mode):
+        logger.warning("Source file not found: %s", source_path)
+        return
+    try:
+        dest_stat = os.stat(dest_file)
+    except OSError:
+        dest_stat = None
+    # Same size and mtime, as _fast_copy keeps the mtime
+    if (dest_stat is not None and dest_stat.st_size == source_stat.st_size
+            and dest_stat.st_mtime_ns == source_stat.st_mtime_ns):
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Skipped %s, %s is up to date", source_path, dest_file)
+        return
+    _fast_copy(source_path, dest_file)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Backed up %s to %s", source_path, dest_file)
+
+def _restore_file(source_file, dest_path, backed_up):
+    """Copy one metadata file from the backup folder into the workspace."""
+    if backed_up:
+        _fast_copy(source_file, dest_path)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Restored %s to %s", source_file, dest_path)
     else:
-        return search_and_save_environments(root_window)
-
-def search_and_save_environments(root_window):
-    """Search for installations and save with unique backup names."""
-    environments = {}
-    backup_names = set()
-    for install_folder in find_installations(root_window):
-        workspace_dir = extract_workspace_dir(install_folder)
-        if workspace_dir:
-            base_name = os.path.basename(install_folder)
-            unique_name = base_name
-            counter = 1
-            while unique_name in backup_names:
-                unique_name = f"{base_name}_{counter}"
-                counter += 1
-            backup_names.add(unique_name)
-            environments[install_folder] = {"workspace_dir": workspace_dir, "backup_name": unique_name}
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(environments, f, indent=4)
-    return environments
+        logger.warning("Backup file missing: %s", source_file)
+
+def _environment_selected(env, environments, root_window):
+    """Check that env is a known environment, telling the user if it isn't."""
+    if env in environments:
+        return True
+    messagebox.showerror("No Environment", "Please select an environment first.", parent=root_window)
+    return False
 
 def backup_files(env, environments, date_dropdown, selected_date, root_window):
     """Backup metadata files and refresh dates."""
+    if not _environment_selected(env, environments, root_window):
+        return
     workspace_dir = environments[env]["workspace_dir"]
     backup_name = environments[env]["backup_name"]
     today = date.today().isoformat()
     backup_folder = os.path.join(ARCHIVE_BASE, backup_name, today)
     os.makedirs(backup_folder, exist_ok=True)
     
-    for filename, rel_path in SOURCE_FILES.items():
-        source_path = os.path.join(workspace_dir, rel_path)
-        dest_file = os.path.join(backup_folder, filename)
-        if os.path.exists(source_path) and os.path.isfile(source_path):
-            shutil.copy2(source_path, dest_file)
-            logging.info(f"Backed up {source_path} to {dest_file}")
-        else:
-            logging.warning(f"Source file not found: {source_path}")
+    dest_prefix = os.path.join(backup_folder, "")
+    sources = [source_path for _, source_path in _workspace_paths(workspace_dir)]
+    dests = [dest_prefix + filename for filename in SOURCE_FILES]
+    with ThreadPoolExecutor(max_workers=len(SOURCE_FILES)) as executor:
+        list(executor.map(_backup_file, sources, dests))
     messagebox.showinfo("Backup Complete", f"Files backed up to {backup_name}/{today}", parent=root_window)
+    _dates_cache.pop(os.path.join(ARCHIVE_BASE, backup_name), None)
     update_date_dropdown(env, date_dropdown, selected_date, environments)
 
+DELETE_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+
+def _remove_entry(entry):
+    """Delete one scandir entry, recursing into folders."""
+    if entry.is_dir(follow_symlinks=False):
+        shutil.rmtree(entry.path)
+    else:
+        os.remove(entry.path)
+
+def _remove_tree(folder):
+    """Delete folder, removing its top-level children in parallel."""
+    # Let rmtree refuse links rather than emptying their target
+    if os.path.islink(folder) or getattr(os.path, "isjunction", lambda path: False)(folder):
+        shutil.rmtree(folder)
+        return
+    with os.scandir(folder) as it:
+        entries = list(it)
+    with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+        futures = [executor.submit(_remove_entry, entry) for entry in entries]
+    for future in futures:
+        future.result()
+    os.rmdir(folder)
+
 def clear_metadata(env, environments, root_window):
     """Delete the .metadata folder."""
+    if not _environment_selected(env, environments, root_window):
+        return
     workspace_dir = environments[env]["workspace_dir"]
     metadata_folder = os.path.join(workspace_dir, ".metadata")
     if not os.path.exists(metadata_folder):
@@ -110,54 +488,70 @@ def clear_metadata(env, environments, root_window):
     
     if messagebox.askyesno("Confirm Clear", f"Delete .metadata folder for {env}? This cannot be undone.", parent=root_window):
         try:
-            shutil.rmtree(metadata_folder)
-            logging.info(f"Deleted {metadata_folder}")
+            _remove_tree(metadata_folder)
+            logger.info("Deleted %s", metadata_folder)
             messagebox.showinfo("Clear Complete", f".metadata folder for {env} deleted", parent=root_window)
         except PermissionError as e:
-            logging.error(f"Permission error deleting {metadata_folder}: {e}")
+            logger.error("Permission error deleting %s: %s", metadata_folder, e)
             messagebox.showerror("Clear Error", f"Permission Error: {e}", parent=root_window)
         except Exception as e:
-            logging.error(f"Error deleting {metadata_folder}: {e}")
+            logger.error("Error deleting %s: %s", metadata_folder, e)
             messagebox.showerror("Clear Error", f"Error: {e}", parent=root_window)
 
 def restore_files(env, date_str, environments, root_window):
     """Restore metadata files from a backup."""
+    if not _environment_selected(env, environments, root_window):
+        return
     workspace_dir = environments[env]["workspace_dir"]
     backup_name = environments[env]["backup_name"]
     backup_folder = os.path.join(ARCHIVE_BASE, backup_name, date_str)
-    if not os.path.exists(backup_folder):
+    try:
+        with os.scandir(backup_folder) as entries:
+            backed_up = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
         messagebox.showerror("Restore Error", f"No backup found for {env} on {date_str}", parent=root_window)
         return
     
-    overwrite = None
-    for filename, rel_path in SOURCE_FILES.items():
-        dest_path = os.path.join(workspace_dir, rel_path)
-            if not overwrite:
-                messagebox.showinfo("Restore Cancelled", "Restore operation cancelled.", parent=root_window)
-                return
-                messagebox.showinfo("Restore Cancelled", "Restore operation cancelled.", parent=root_window)
-                return
-            break
+    backup_prefix = os.path.join(backup_folder, "")
+    paths = _workspace_paths(workspace_dir)
+    # (source, destination, backed up?) per file
+    plan = [(backup_prefix + filename, dest_path, filename in backed_up) for filename, dest_path in paths]
+    dest_listings = _list_parents(dest_path for _, dest_path in paths)
+    if any(filename in (dest_listings[os.path.dirname(dest_path)] or ()) for filename, dest_path in paths):
+        if not messagebox.askyesno("Confirm Overwrite", f"Overwrite existing metadata files for {env}?", parent=root_window):
+            messagebox.showinfo("Restore Cancelled", "Restore operation cancelled.", parent=root_window)
+            return
     
-    for filename, rel_path in SOURCE_FILES.items():
-    os.makedirs(os.path.dirname(next(iter(SOURCE_FILES.values()))), exist_ok=True)
-    for filename, rel_path in SOURCE_FILES.items():
-        source_file = os.path.join(backup_folder, filename)
-        dest_path = os.path.join(workspace_dir, rel_path)
-        if os.path.exists(source_file):
-            shutil.copy2(source_file, dest_path)
-            logging.info(f"Restored {source_file} to {dest_path}")
-        else:
-            logging.warning(f"Backup file missing: {source_file}")
+    for parent, names in dest_listings.items():
+        if names is None:
+            os.makedirs(parent, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=len(plan)) as executor:
+        list(executor.map(lambda step: _restore_file(*step), plan))
+
+# Backup dates per archive folder, with its mtime
+_dates_cache = {}
+
+def _list_backup_dates(env_archive):
+    """Return the backup dates in env_archive newest first, or None if it is missing."""
+    try:
+        mtime = os.stat(env_archive).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    cached = _dates_cache.get(env_archive)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with os.scandir(env_archive) as entries:
+        dates = sorted((entry.name for entry in entries if entry.is_dir(follow_symlinks=False)), reverse=True)
+    _dates_cache[env_archive] = (mtime, dates)
+    return dates
 
 def update_date_dropdown(env, date_dropdown, selected_date, environments):
     """Update the backup date dropdown with correct dates."""
     if env in environments:
         backup_name = environments[env]["backup_name"]
         env_archive = os.path.join(ARCHIVE_BASE, backup_name)
-        if os.path.exists(env_archive):
-            dates = [d for d in os.listdir(env_archive) if os.path.isdir(os.path.join(env_archive, d))]
-            dates = sorted(dates, reverse=True)
+        dates = _list_backup_dates(env_archive)
+        if dates is not None:
             date_dropdown["values"] = dates
             selected_date.set(dates[0] if dates else "No backups found")
         else:
@@ -173,17 +567,10 @@ def add_manual_environment(environments, env_dropdown, selected_env, date_dropdo
     if folder:
         workspace_dir = extract_workspace_dir(folder)
         if workspace_dir:
-            base_name = os.path.basename(folder)
-            existing_backup_names = [e["backup_name"] for e in environments.values()]
-            unique_name = base_name
-            counter = 1
-            while unique_name in existing_backup_names:
-                unique_name = f"{base_name}_{counter}"
-                counter += 1
-            existing_backup_names.append(unique_name)
+            existing_backup_names = {e["backup_name"] for e in environments.values()}
+            unique_name = _unique_backup_name(os.path.basename(folder), existing_backup_names, Counter())
             environments[folder] = {"workspace_dir": workspace_dir, "backup_name": unique_name}
-            with open(CONFIG_FILE, "w") as f:
-                json.dump(environments, f, indent=4)
+            save_config(environments)
             env_dropdown["values"] = list(environments.keys())
             selected_env.set(folder)
             update_date_dropdown(folder, date_dropdown, selected_date, environments)
@@ -191,18 +578,13 @@ def add_manual_environment(environments, env_dropdown, selected_env, date_dropdo
         else:
             messagebox.showerror("Invalid Folder", "No valid WORKSPACE_DIR found in pim-desktop.cmd", parent=root_window)
 
-def create_gui(environments):
-    """Create the GUI."""
-    root = Tk()
+def create_gui(root, environments, search=False):
+    """Build the GUI on root, optionally searching for installations in the background."""
     root.title("Product 360 Layout Manager")
     root.geometry("800x600")
 
-    env_list = list(environments.keys())
-    if env_list:
-        max_path_length = max(len(path) for path in env_list)
-        dropdown_width = min(max_path_length, 100)
-    else:
-        dropdown_width = 50
+    env_list = list(environments)
+    dropdown_width = min(max(map(len, env_list), default=50), 100)
 
     ttk.Label(root, text="Select Environment:").pack(pady=5)
     selected_env = StringVar()
@@ -225,9 +607,92 @@ def create_gui(environments):
     ttk.Button(root, text="Backup Now", command=lambda: backup_files(selected_env.get(), environments, date_dropdown, selected_date, root)).pack(pady=5)
     ttk.Button(root, text="Clear Metadata", command=lambda: clear_metadata(selected_env.get(), environments, root)).pack(pady=5)
     ttk.Button(root, text="Restore Metadata", command=lambda: restore_files(selected_env.get(), selected_date.get(), environments, root)).pack(pady=5)
-    ttk.Button(root, text="Add Manual Location", command=lambda: add_manual_environment(environments, env_dropdown, selected_env, date_dropdown, selected_date, root)).pack(pady=5)
+    manual_button = ttk.Button(root, text="Add Manual Location", command=lambda: add_manual_environment(environments, env_dropdown, selected_env, date_dropdown, selected_date, root))
+    manual_button.pack(pady=5)
+
+    status = StringVar()
+    results = queue.Queue()
+    searching = False
+    cancel = threading.Event()
+
+    def start_search():
+        nonlocal searching
+        if searching:
+            return
+        searching = True
+        cancel.clear()
+        status.set("Searching for Product 360 installations...")
+        progress.pack(pady=5)
+        progress.start(50)
+        cancel_button.pack(pady=5)
+        # The search hands out backup names from its own snapshot of the taken ones
+        manual_button.state(["disabled"])
+        threading.Thread(target=discover, daemon=True).start()
+        root.after(100, poll_results)
+
+    def discover():
+        scan_meta = None
+        try:
+            scan_meta = search_environments(lambda folder, entry: results.put((folder, entry)), cancel)
+        except Exception:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("Search error: %s", traceback.format_exc())
+        results.put((None, scan_meta))
+
+    def poll_results():
+        while True:
+            try:
+                folder, entry = results.get_nowait()
+            except queue.Empty:
+                break
+            if folder is None:
+                finish_search(entry)
+                return
+            environments[folder] = entry
+            env_dropdown["values"] = list(environments.keys())
+            env_dropdown["width"] = min(max(map(len, environments)), 100)
+            if not selected_env.get():
+                selected_env.set(folder)
+        root.after(100, poll_results)
+
+    def finish_search(scan_meta):
+        nonlocal searching
+        searching = False
+        progress.stop()
+        progress.pack_forget()
+        cancel_button.pack_forget()
+        manual_button.state(["!disabled"])
+        if scan_meta is None:
+            status.set("Search failed, see the log for details.")
+            return
+        found = len(environments)
+        # Keep the saved environments that still exist, e.g. manually added ones
+        for folder, entry in load_config()["environments"].items():
+            if folder not in environments and os.path.isdir(folder):
+                environments[folder] = entry
+        if environments:
+            env_dropdown["values"] = list(environments)
+            env_dropdown["width"] = min(max(map(len, environments)), 100)
+            if not selected_env.get():
+                selected_env.set(next(iter(environments)))
+        save_config(environments, scan_meta)
+        if cancel.is_set():
+            status.set(f"Search cancelled: {found} installation(s) found.")
+            return
+        status.set(f"Search complete: {found} installation(s) found.")
+        if not environments:
+            messagebox.showerror("No Environments", "No Product 360 installations found. Please install or add manually.", parent=root)
+
+    ttk.Button(root, text="Search Again", command=start_search).pack(pady=5)
+    ttk.Label(root, textvariable=status).pack(pady=5)
+    progress = ttk.Progressbar(root, mode="indeterminate", length=300)
+    cancel_button = ttk.Button(root, text="Cancel Search", command=cancel.set)
+    if search:
+        start_search()
 
     root.mainloop()
+    # Stop a running search so the process can exit
+    cancel.set()
 
 def main():
     """Main entry point."""
@@ -236,15 +701,18 @@ def main():
         root.withdraw()
         root.update_idletasks()  # Ensure the root window is properly hidden
         environments = load_or_find_environments(root)
-        if not environments:
+        if environments is not None and not environments:
             messagebox.showerror("No Environments", "No Product 360 installations found. Please install or add manually.", parent=root)
             root.destroy()
             return
-        root.destroy()
-        create_gui(environments)
-        logging.error(f"Startup error: {traceback.format_exc()}")
-        messagebox.showerror("Error", f"Failed to start: {e}")
-        logging.error(f"Startup error: {traceback.format_exc()}")
+        root.deiconify()
+        if environments is None:
+            create_gui(root, {}, search=True)
+        else:
+            create_gui(root, environments)
+    except Exception as e:
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Startup error: %s", traceback.format_exc())
         messagebox.showerror("Error", f"Failed to start: {e}")
 
 if __name__ == "__main__":